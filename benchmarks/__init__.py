@@ -0,0 +1 @@
+"""easy_utils benchmark suite. Run with `python -m benchmarks --help`."""
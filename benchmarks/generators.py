@@ -0,0 +1,125 @@
+"""
+Synthetic input generators for the benchmark suite.
+All generators are deterministic (seeded) so results are comparable across commits.
+"""
+from __future__ import annotations
+from typing import List, Optional, Sequence
+import os
+import random
+
+
+def make_file_tree(
+    root: str,
+    depth: int = 4,
+    breadth: int = 4,
+    files_per_dir: int = 10,
+    exts: Sequence[str] = ('.txt', '.wav', '.json', '.csv'),
+    hidden_ratio: float = 0.1,
+    file_size: int = 64,
+    seed: int = 0,
+    dup_ratio: Optional[float] = None,
+) -> List[str]:
+    """
+    Create a deep directory tree for extlist / copy_all_files.
+    breadth**depth leaf-ish directories, `files_per_dir` files in every directory.
+    About `hidden_ratio` of the files/dirs start with '.'.
+    dup_ratio=None: every file is `file_size` bytes of b'x'.
+    dup_ratio=0.2: random contents of file_size//2..file_size bytes in 1 KiB steps (so sizes collide),
+    and about 20% of the files are copies of an earlier file (for find_duplicates).
+    Returns the list of created file paths.
+    """
+    rng = random.Random(seed)
+    payload = b'x' * file_size
+    payloads: List[bytes] = []
+    created = []
+
+    def _payload() -> bytes:
+        if dup_ratio is None:
+            return payload
+        if payloads and rng.random() < dup_ratio:
+            return rng.choice(payloads)
+        size = rng.randint(max(1, file_size // 2), file_size) // 1024 * 1024 or file_size  # 1 KiB steps
+        data = rng.randbytes(size)
+        payloads.append(data)
+        return data
+
+    def _name(base: str) -> str:
+        return ('.' + base) if rng.random() < hidden_ratio else base
+
+    def _fill(cur: str, level: int):
+        os.makedirs(cur, exist_ok=True)
+        for i in range(files_per_dir):
+            path = os.path.join(cur, _name(f'file_{i}') + exts[i % len(exts)])
+            with open(path, 'wb') as f:
+                f.write(_payload())
+            created.append(path)
+        if level < depth:
+            for b in range(breadth):
+                _fill(os.path.join(cur, _name(f'dir_{level}_{b}')), level + 1)
+
+    _fill(root, 1)
+    return created
+
+
+def make_subtitle_csv(path: str, n_rows: int = 10000, seed: int = 0) -> str:
+    """
+    Create a subtitle CSV in the csv_to_srt format (hh:mm:ss:ms time columns).
+    Rows are shuffled so the sort step does real work.
+    """
+    rng = random.Random(seed)
+    speakers = ['Alice', 'Bob', 'Carol', 'Dave']
+    rows = []
+    for i in range(n_rows):
+        start_ms = i * 2000
+        end_ms = start_ms + 1500
+        rows.append((
+            _fmt_time(start_ms),
+            _fmt_time(end_ms),
+            speakers[i % len(speakers)],
+            f'안녕하세요 line {i}',
+            f'hello line {i}',
+        ))
+    rng.shuffle(rows)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('Start Time,End Time,Speaker Name,ko,en\n')
+        for row in rows:
+            f.write(','.join(row) + '\n')
+    return path
+
+
+def _fmt_time(ms: int) -> str:
+    h, rem = divmod(ms, 3600000)
+    m, rem = divmod(rem, 60000)
+    s, ms = divmod(rem, 1000)
+    return f'{h:02d}:{m:02d}:{s:02d}:{ms:03d}'
+
+
+def make_templated_yaml(path: str, n_keys: int = 2000, n_inputs: int = 50) -> str:
+    """
+    Create a large read_yaml template: an `inputs:` block with `n_inputs` typed
+    variables, then `n_keys` entries mixing plain values, {{ var }} and |default().
+    """
+    types = ['str', 'int', 'float', 'bool']
+    defaults = {'str': '"value"', 'int': '3', 'float': '0.5', 'bool': 'true'}
+    lines = ['# synthetic benchmark template', 'inputs:']
+    for i in range(n_inputs):
+        kind = types[i % len(types)]
+        lines += [f'  var_{i}:', f'    type: {kind}', f'    default: {defaults[kind]}']
+    lines.append('')
+    lines.append('root_path: "{{ root_path | default(\'/tmp/out\') }}"')
+    for i in range(n_keys):
+        if i % 3 == 0:
+            lines.append(f'key_{i}: "{{{{ var_{i % n_inputs} }}}}"')
+        elif i % 3 == 1:
+            lines.append(f'key_{i}: "{{{{ root_path }}}}/item_{i}"')
+        else:
+            lines.append(f'key_{i}:')
+            lines.append(f'  name: "{{{{ opt_{i % 17} | default(\'n{i}\') }}}}"')
+            lines.append(f'  index: {i}')
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return path
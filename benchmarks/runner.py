@@ -0,0 +1,242 @@
+"""
+Benchmark runner: timing, JSON result files and regression comparison.
+
+    python -m benchmarks run --out bench.json            # run everything
+    python -m benchmarks run -k extlist --quick          # subset, small inputs
+    python -m benchmarks compare base.json bench.json    # exit 1 on regression
+
+Result file format:
+    {
+      "meta": {"commit": ..., "python": ..., "platform": ..., "created": ..., "quick": ...},
+      "results": {"<name>": {"median": s, "min": s, "mean": s, "stdev": s,
+                             "number": calls per repeat, "repeat": repeats}}
+    }
+Times are seconds per call.
+"""
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+
+THRESHOLDS_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'thresholds.json')
+DEFAULT_THRESHOLD = 0.10  # 10% slower than the baseline -> regression
+
+# name -> setup(workdir, quick) -> callable to time
+BENCHMARKS: Dict[str, Callable[[str, bool], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """Register `setup(workdir, quick)`; it builds inputs and returns the callable to time."""
+    def deco(setup):
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        BENCHMARKS[name] = setup
+        return setup
+    return deco
+
+
+def time_callable(fn: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+    """Calibrate the number of calls so one repeat takes >= min_time, then time `repeat` rounds."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 10 ** 7:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    per_call = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'median': statistics.median(per_call),
+        'min': min(per_call),
+        'mean': statistics.fmean(per_call),
+        'stdev': statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_benchmarks(pattern: Optional[str] = None, quick: bool = False, repeat: int = 5,
+                   min_time: float = 0.2, verbose: bool = True) -> Dict[str, object]:
+    from . import suite  # noqa: F401  (registers benchmarks)
+
+    names = [n for n in BENCHMARKS if pattern is None or pattern in n]
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        with tempfile.TemporaryDirectory(prefix=f'bench_{name}_') as workdir:
+            fn = BENCHMARKS[name](workdir, quick)
+            results[name] = time_callable(fn, repeat=repeat, min_time=min_time)
+        if verbose:
+            r = results[name]
+            print(f"{name:<32} median {_fmt_seconds(r['median']):>10}  "
+                  f"min {_fmt_seconds(r['min']):>10}  (x{r['number']}, {r['repeat']} repeats)")
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+
+def load_thresholds(path: Optional[str] = THRESHOLDS_JSON) -> Dict[str, float]:
+    """{"default": 0.1, "<benchmark name>": 0.25, ...}. Missing file -> {}."""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return {k: float(v) for k, v in json.load(f).items()}
+
+
+META_KEYS = ('quick', 'python', 'platform')  # must match for a comparison to mean anything
+
+
+def meta_mismatches(base: Dict[str, object], new: Dict[str, object]) -> List[str]:
+    """['quick: False != True', ...] for the META_KEYS that differ between two result files."""
+    base_meta, new_meta = base.get('meta', {}), new.get('meta', {})
+    return [f"{k}: {base_meta.get(k)!r} != {new_meta.get(k)!r}"
+            for k in META_KEYS if base_meta.get(k) != new_meta.get(k)]
+
+
+def compare_results(base: Dict[str, object], new: Dict[str, object],
+                    thresholds: Optional[Dict[str, float]] = None, stat: str = 'median',
+                    allow_mismatch: bool = False) -> List[Dict[str, object]]:
+    """
+    Compare two result files benchmark by benchmark.
+    A benchmark regresses when new/base - 1 > its threshold
+    (thresholds[name], else thresholds['default'], else DEFAULT_THRESHOLD).
+    Benchmarks present in only one file are reported with status 'added' / 'removed'.
+    Raises ValueError if the runs differ in quick/python/platform, unless allow_mismatch=True.
+    """
+    mismatches = meta_mismatches(base, new)
+    if mismatches and not allow_mismatch:
+        raise ValueError("Benchmark runs are not comparable (" + "; ".join(mismatches) + ")")
+    thresholds = thresholds or {}
+    default = thresholds.get('default', DEFAULT_THRESHOLD)
+    base_res, new_res = base['results'], new['results']
+    rows = []
+    for name in sorted(set(base_res) | set(new_res)):
+        if name not in new_res:
+            rows.append({'name': name, 'status': 'removed'})
+            continue
+        if name not in base_res:
+            rows.append({'name': name, 'status': 'added', 'new': new_res[name][stat]})
+            continue
+        b, n = base_res[name][stat], new_res[name][stat]
+        change = (n / b - 1.0) if b > 0 else 0.0
+        limit = thresholds.get(name, default)
+        if change > limit:
+            status = 'regression'
+        elif change < -limit:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({'name': name, 'status': status, 'base': b, 'new': n, 'change': change, 'threshold': limit})
+    return rows
+
+
+def _fmt_seconds(s: float) -> str:
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if s >= scale:
+            return f'{s / scale:.3f}{unit}'
+    return f'{s / 1e-9:.1f}ns'
+
+
+def _print_comparison(rows: List[Dict[str, object]]):
+    for r in rows:
+        if 'change' in r:
+            print(f"{r['name']:<32} {_fmt_seconds(r['base']):>10} -> {_fmt_seconds(r['new']):>10}  "
+                  f"{r['change'] * 100:+7.1f}% (limit {r['threshold'] * 100:.0f}%)  {r['status']}")
+        else:
+            print(f"{r['name']:<32} {r['status']}")
+
+
+def _parse_threshold_overrides(items: List[str]) -> Dict[str, float]:
+    out = {}
+    for item in items:
+        name, sep, value = item.partition('=')
+        if not sep:
+            raise SystemExit(f"--threshold-for expects NAME=FRACTION, got {item!r}")
+        out[name] = float(value)
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='easy_utils benchmark suite')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_run = sub.add_parser('run', help='run benchmarks and write a JSON result file')
+    p_run.add_argument('-k', dest='pattern', default=None, help='only run benchmarks whose name contains this')
+    p_run.add_argument('--quick', action='store_true', help='small inputs (smoke test)')
+    p_run.add_argument('--repeat', type=int, default=5)
+    p_run.add_argument('--min-time', type=float, default=0.2, help='minimum seconds per repeat')
+    p_run.add_argument('--out', default=None, help='result JSON path')
+    p_run.add_argument('--list', action='store_true', help='list benchmark names and exit')
+
+    p_cmp = sub.add_parser('compare', help='compare two result files; exit 1 on regression')
+    p_cmp.add_argument('base')
+    p_cmp.add_argument('new')
+    p_cmp.add_argument('--threshold', type=float, default=None,
+                       help=f'default allowed slowdown as a fraction (default {DEFAULT_THRESHOLD})')
+    p_cmp.add_argument('--threshold-for', action='append', default=[], metavar='NAME=FRACTION',
+                       help='per-benchmark override, repeatable')
+    p_cmp.add_argument('--thresholds', default=THRESHOLDS_JSON, help='thresholds JSON file')
+    p_cmp.add_argument('--stat', choices=['median', 'min', 'mean'], default='median')
+    p_cmp.add_argument('--allow-mismatch', action='store_true',
+                       help='compare runs with different quick/python/platform (warn instead of refusing)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        if args.list:
+            from . import suite  # noqa: F401
+            print('\n'.join(BENCHMARKS))
+            return 0
+        data = run_benchmarks(args.pattern, quick=args.quick, repeat=args.repeat, min_time=args.min_time)
+        if args.out:
+            os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+            with open(args.out, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            print(f"\033[92mBenchmark results saved to {args.out}\033[0m")
+        return 0
+
+    with open(args.base, 'r', encoding='utf-8') as f:
+        base = json.load(f)
+    with open(args.new, 'r', encoding='utf-8') as f:
+        new = json.load(f)
+    thresholds = load_thresholds(args.thresholds)
+    if args.threshold is not None:
+        thresholds['default'] = args.threshold
+    thresholds.update(_parse_threshold_overrides(args.threshold_for))
+
+    mismatches = meta_mismatches(base, new)
+    if mismatches and not args.allow_mismatch:
+        print(f"\033[91mRefusing to compare: {'; '.join(mismatches)} (use --allow-mismatch to override)\033[0m")
+        return 2
+    if mismatches:
+        print(f"\033[93mWarning: runs differ in {'; '.join(mismatches)}\033[0m")
+    rows = compare_results(base, new, thresholds, stat=args.stat, allow_mismatch=True)
+    _print_comparison(rows)
+    regressions = [r['name'] for r in rows if r['status'] == 'regression']
+    if regressions:
+        print(f"\033[91m{len(regressions)} regression(s): {', '.join(regressions)}\033[0m")
+        return 1
+    return 0
@@ -0,0 +1,139 @@
+"""
+Benchmark definitions. Each setup builds its inputs under `workdir` and returns the callable to time.
+`quick=True` shrinks inputs so the whole suite runs in a few seconds.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import os
+
+from .generators import make_file_tree, make_subtitle_csv, make_templated_yaml
+from .runner import benchmark
+
+
+def _silent(fn):
+    """Swallow stdout (printline / csv_to_srt print on every call)."""
+    def wrapped():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+    return wrapped
+
+
+def _tree(workdir: str, quick: bool) -> str:
+    root = os.path.join(workdir, 'tree')
+    if quick:
+        make_file_tree(root, depth=3, breadth=3, files_per_dir=5)
+    else:
+        make_file_tree(root, depth=5, breadth=4, files_per_dir=10)  # 341 dirs, 3410 files
+    return root
+
+
+def _dup_tree(workdir: str, quick: bool) -> str:
+    """Varied sizes / contents, ~20% duplicates: exercises size, partial and full hash steps."""
+    root = os.path.join(workdir, 'dup_tree')
+    if quick:
+        make_file_tree(root, depth=3, breadth=3, files_per_dir=5, file_size=8 << 10, dup_ratio=0.2)
+    else:
+        make_file_tree(root, depth=4, breadth=4, files_per_dir=10, file_size=256 << 10, dup_ratio=0.2)  # 850 files, ~160 MB
+    return root
+
+
+# --- micro: printline / path helpers -------------------------------------------
+
+@benchmark('printline')
+def _printline(workdir, quick):
+    from easy_utils import printline
+    return _silent(lambda: printline('hello', 123, {'a': 1}, string_color='green'))
+
+@benchmark('path_helpers')
+def _path_helpers(workdir, quick):
+    from easy_utils import change_suffix, suffix, prefix, prefix_basename, remove_suffix
+    paths = [f'/data/videos/uri_{i}/audio/track_{i}.wav' for i in range(100)]
+
+    def run():
+        for p in paths:
+            suffix(p)
+            prefix(p)
+            prefix_basename(p)
+            remove_suffix(p)
+            change_suffix(p, 'mp4')
+    return run
+
+
+# --- file trees: extlist / copy_all_files --------------------------------------
+
+@benchmark('extlist_deep')
+def _extlist_deep(workdir, quick):
+    from easy_utils import extlist
+    root = _tree(workdir, quick)
+    return lambda: extlist(root, '.wav')
+
+@benchmark('extlist_deep_multi_sorted')
+def _extlist_deep_multi_sorted(workdir, quick):
+    from easy_utils import extlist
+    root = _tree(workdir, quick)
+    return lambda: extlist(root, ['.wav', '.json', '.txt'], sort=True)
+
+@benchmark('copy_all_files')
+def _copy_all_files(workdir, quick):
+    from easy_utils import copy_all_files
+    src = _tree(workdir, quick)
+    dst = os.path.join(workdir, 'copy')
+    return lambda: copy_all_files(src, dst)
+
+
+# --- io_utils: csv_to_srt / read_yaml ------------------------------------------
+
+@benchmark('csv_to_srt')
+def _csv_to_srt(workdir, quick):
+    from easy_utils.io_utils import csv_to_srt
+    csv_path = make_subtitle_csv(os.path.join(workdir, 'subs.csv'), n_rows=500 if quick else 20000)
+    srt_path = os.path.join(workdir, 'subs.srt')
+    return _silent(lambda: csv_to_srt(csv_path, srt_path, include_speaker=True))
+
+@benchmark('read_yaml')
+def _read_yaml(workdir, quick):
+    from easy_utils import read_yaml
+    yaml_path = make_templated_yaml(os.path.join(workdir, 'config.yaml'), n_keys=200 if quick else 5000)
+    return lambda: read_yaml(yaml_path, ctx={'root_path': '/tmp/bench', 'var_0': 'ctx'})
+
+
+# --- hash_utils: find_duplicates -----------------------------------------------
+
+@benchmark('find_duplicates_cold')
+def _find_duplicates_cold(workdir, quick):
+    from easy_utils import find_duplicates
+    root = _dup_tree(workdir, quick)
+    return lambda: find_duplicates(root, ('.wav', '.json'))
+
+@benchmark('find_duplicates_cached')
+def _find_duplicates_cached(workdir, quick):
+    from easy_utils import find_duplicates
+    root = _dup_tree(workdir, quick)
+    cache_path = os.path.join(workdir, 'hash_cache.json')
+    find_duplicates(root, ('.wav', '.json'), cache_path=cache_path)
+    return lambda: find_duplicates(root, ('.wav', '.json'), cache_path=cache_path)
+
+
+# --- base_io: bulk construction ------------------------------------------------
+
+def _manifest(quick):
+    return [{'uri': f'uri_{i:06d}', 'root_path': '/data/videos', 'force': i % 2 == 0} for i in range(1000 if quick else 50000)]
+
+@benchmark('base_io_per_row')
+def _base_io_per_row(workdir, quick):
+    from easy_utils import Base_io
+    records = _manifest(quick)
+    return lambda: [Base_io(**r) for r in records]
+
+@benchmark('base_io_table_from_records')
+def _base_io_table_from_records(workdir, quick):
+    from easy_utils import Base_io_table
+    records = _manifest(quick)
+    return lambda: Base_io_table.from_records(records)
+
+@benchmark('base_io_table_iter_ios')
+def _base_io_table_iter_ios(workdir, quick):
+    from easy_utils import Base_io_table
+    table = Base_io_table.from_records(_manifest(quick))
+    return lambda: list(table.iter_ios())
@@ -1,5 +1,58 @@
-from .os_utils import extlist, change_suffix, suffix, prefix, prefix_basename, remove_suffix
-from .log_utils import printline, find_package_path, copy_all_files, find_assets_path, find_root_path
-from .base_io import Base_io
-from .base_task import BaseTask
-from .io_utils import read_yaml
\ No newline at end of file
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# public name -> submodule. Submodules are imported on first attribute access,
+# so `import easy_utils` stays cheap (no pandas / pydantic / jinja2 until needed).
+_LAZY_ATTRS = {
+    'extlist': 'os_utils',
+    'change_suffix': 'os_utils',
+    'suffix': 'os_utils',
+    'prefix': 'os_utils',
+    'prefix_basename': 'os_utils',
+    'remove_suffix': 'os_utils',
+    'printline': 'log_utils',
+    'find_package_path': 'log_utils',
+    'copy_all_files': 'log_utils',
+    'find_assets_path': 'log_utils',
+    'find_root_path': 'log_utils',
+    'Base_io': 'base_io',
+    'Base_io_table': 'base_io',
+    'MetadataStore': 'metadata_store',
+    'BaseTask': 'base_task',
+    'read_yaml': 'io_utils',
+    'hash_file': 'hash_utils',
+    'find_duplicates': 'hash_utils',
+    'duplicate_report': 'hash_utils',
+    'HashCache': 'hash_utils',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .os_utils import extlist, change_suffix, suffix, prefix, prefix_basename, remove_suffix
+    from .log_utils import printline, find_package_path, copy_all_files, find_assets_path, find_root_path
+    from .base_io import Base_io, Base_io_table
+    from .metadata_store import MetadataStore
+    from .base_task import BaseTask
+    from .io_utils import read_yaml
+    from .hash_utils import hash_file, find_duplicates, duplicate_report, HashCache
+
+# submodules stay reachable as attributes (easy_utils.io_utils.csv_to_srt)
+_SUBMODULES = {
+    'os_utils', 'log_utils', 'io_utils', 'base_io', 'base_task',
+    'metadata_store', 'hash_utils', 'cli',
+}
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return import_module(f'.{name}', __name__)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # cache: next access skips __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -1,6 +1,10 @@
 from __future__ import annotations
-from pydantic import BaseModel, Field
-from typing import Dict, Any
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Union
+import os
+import sys
+import copy
+import json
 
 class Base_io(BaseModel):
     """
@@ -15,7 +19,317 @@ class Base_io(BaseModel):
     force: bool = Field(default=False, description="Force overwrite existing files.")
     jinja: Dict[str, Any] = Field(default_factory=dict)
 
+    @property
+    def metadata_path(self) -> str:
+        """root_path/uri/metadata_json"""
+        return os.path.join(self.root_path, self.uri, self.metadata_json)
+
+    def read_metadata(self) -> Dict[str, Any]:
+        """Read this uri's metadata through MetadataStore ({} if missing)."""
+        from .metadata_store import MetadataStore
+        return MetadataStore.from_io(self).get(self.uri)
+
+    def write_metadata(self, data: Dict[str, Any]) -> str:
+        """Atomically write this uri's metadata through MetadataStore."""
+        from .metadata_store import MetadataStore
+        return MetadataStore.from_io(self).put(self.uri, data)
+
+MISSING = object()  # Base_io_table cell with no value (filled from defaults)
+
+class _Const:
+    """Column whose every row has the same value (stored once)."""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+def _is_na(v) -> bool:
+    """DataFrame/CSV cell with no value: None, NaN, pd.NA, NaT (dict / list jinja cells never are)."""
+    if v is MISSING or v is None:
+        return True
+    pd = sys.modules.get("pandas")  # tabular 입력이면 이미 import 되어 있음
+    if pd is None:
+        return isinstance(v, float) and v != v
+    # pd.NA 는 v != v 가 bool 이 아니므로 pd.isna 로 판별 (scalar 만)
+    return pd.api.types.is_scalar(v) and bool(pd.isna(v))
+
+_DEFAULTS: Dict[str, Any] = {}
+
+def _field_default(name: str):
+    # Base_io 필드 기본값 (필드마다 한 번만 조회, default_factory 는 매번 새로 생성)
+    if name not in _DEFAULTS:
+        field = Base_io.model_fields[name]
+        _DEFAULTS[name] = (field.default_factory, field.default)
+    factory, default = _DEFAULTS[name]
+    return factory() if factory is not None else default
+
+_ADAPTERS: Dict[str, TypeAdapter] = {}
+
+def _column_adapter(name: str) -> TypeAdapter:
+    # Base_io 필드 타입 그대로 리스트 단위로 검증 (모델과 동작을 맞추기 위함)
+    if name not in _ADAPTERS:
+        _ADAPTERS[name] = TypeAdapter(List[Base_io.model_fields[name].annotation])
+    return _ADAPTERS[name]
+
+class Base_io_table:
+    """
+    Columnar table of Base_io rows, validated in bulk.
+
+    Builds from a list of dicts, a DataFrame or a CSV. Each column is validated once with the
+    Base_io field types (uri required; root_path / metadata_json / force / jinja get the same
+    defaults as Base_io). Columns where every row has the same value are stored once.
+    Rows are lightweight Base_io_row views; call .to_io() to get a real Base_io.
+
+    table = Base_io_table.from_csv("manifest.csv", root_path="/data/videos")
+    for row in table:
+        task.io = row.to_io()
+    """
+    __slots__ = ("_columns", "_n")
+
+    COLUMNS = ("uri", "root_path", "metadata_json", "force", "jinja")
+
+    def __init__(self, columns: Dict[str, Iterable[Any]], n: Optional[int] = None, tabular: bool = False, **defaults):
+        """
+        columns: {field name: values}. Unknown columns are ignored (like Base_io).
+            A cell equal to MISSING (e.g. a key absent from a record) is filled from `defaults`,
+            then from the Base_io field default. Any other value is validated like Base_io (None included).
+        tabular: DataFrame/CSV input. None/NaN/pd.NA cells count as MISSING and string jinja cells are parsed as JSON.
+        defaults: table-wide values for missing cells (e.g. root_path="/data").
+        """
+        unknown = set(defaults) - set(self.COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown Base_io fields: {sorted(unknown)}")
+        columns = {k: list(v) for k, v in columns.items() if k in self.COLUMNS}
+        if n is None:
+            n = len(columns["uri"]) if "uri" in columns else 0
+        for k, v in columns.items():
+            if len(v) != n:
+                raise ValueError(f"Column '{k}' has {len(v)} values, expected {n}")
+        self._n = n
+        self._columns: Dict[str, Union[list, _Const]] = {}
+
+        errors: List[str] = []
+        for name in self.COLUMNS:
+            field = Base_io.model_fields[name]
+            if name not in columns:
+                if name in defaults:
+                    columns[name] = [defaults[name]] * n
+                elif field.is_required():
+                    errors.append(f"{name}: Field required (column missing)")
+                    continue
+                else:
+                    self._columns[name] = _Const(None)  # None -> Base_io default, resolved on access
+                    continue
+            values = columns[name]
+
+            if tabular:
+                # None / NaN / pd.NA -> missing
+                missing = [i for i, v in enumerate(values) if _is_na(v)]
+            else:
+                missing = [i for i, v in enumerate(values) if v is MISSING]
+            if missing and name in defaults:
+                for i in missing:
+                    values[i] = defaults[name]
+                missing = []
+            elif missing and field.is_required():
+                errors += [f"row {i}, {name}: Field required" for i in missing]
+            # 검증 후에도 None 으로 남은 칸 = Base_io 기본값 (명시적 None 은 검증에서 걸러짐)
+            skip = set(missing)
+            if name == "jinja" and tabular:
+                # CSV cell 등 문자열은 JSON 으로 해석 (실패한 행은 검증에서 제외)
+                for i, v in enumerate(values):
+                    if i not in skip and isinstance(v, str):
+                        try:
+                            values[i] = json.loads(v)
+                        except ValueError as e:
+                            errors.append(f"row {i}, {name}: Invalid JSON ({e})")
+                            skip.add(i)
+
+            idx = [i for i in range(n) if i not in skip] if skip else range(n)
+            present = [values[i] for i in idx] if skip else values
+
+            # 대부분은 빈 칸이 없으므로 리스트 전체를 한 번에 검증
+            try:
+                checked = _column_adapter(name).validate_python(present)
+            except ValidationError as e:
+                errors += [f"row {idx[err['loc'][0]]}, {name}: {err['msg']}" for err in e.errors()]
+                continue
+            if skip:
+                values = [None] * n
+                for i, v in zip(idx, checked):
+                    values[i] = v
+            else:
+                values = checked
+            self._columns[name] = self._compact(name, values)
+
+        if errors:
+            shown = "\n  ".join(errors[:20])
+            more = f"\n  ... and {len(errors) - 20} more" if len(errors) > 20 else ""
+            raise ValueError(f"{len(errors)} validation error(s) for Base_io_table\n  {shown}{more}")
+
+    @staticmethod
+    def _compact(name: str, values: list) -> Union[list, _Const]:
+        if not values:
+            return values
+        first = values[0]
+        if (name != "jinja" or first is None) and values.count(first) == len(values):
+            return _Const(first)
+        if name in ("root_path", "metadata_json"):
+            return [sys.intern(v) if v is not None else None for v in values]
+        return values
+
+    # --- constructors --------------------------------------------------------
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]], **defaults) -> "Base_io_table":
+        """From a list of dicts (missing keys -> defaults; values validated exactly like Base_io)."""
+        records = list(records)
+        names = set().union(*map(dict.keys, records)) & set(cls.COLUMNS)
+        columns = {k: [r.get(k, MISSING) for r in records] for k in names}
+        return cls(columns, n=len(records), **defaults)
+
+    @classmethod
+    def from_dataframe(cls, df, **defaults) -> "Base_io_table":
+        """From a pandas DataFrame (NaN/None/pd.NA cells -> defaults; jinja cells may be JSON strings)."""
+        columns = {k: df[k].astype(object).tolist() for k in df.columns if k in cls.COLUMNS}
+        return cls(columns, n=len(df), tabular=True, **defaults)
+
+    @classmethod
+    def from_csv(cls, csv_file: str, **defaults) -> "Base_io_table":
+        """From a CSV with Base_io columns (uri required; jinja cells as JSON)."""
+        import pandas as pd
+        df = pd.read_csv(csv_file, dtype={"uri": str, "root_path": str, "metadata_json": str})
+        return cls.from_dataframe(df, **defaults)
+
+    # --- access --------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i: int) -> "Base_io_row":
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError(f"Base_io_table index out of range: {i}")
+        return Base_io_row(self, i)
+
+    def __iter__(self) -> Iterator["Base_io_row"]:
+        for i in range(self._n):
+            yield Base_io_row(self, i)
+
+    def __repr__(self) -> str:
+        return f"Base_io_table(n={self._n})"
+
+    def value(self, name: str, i: int):
+        col = self._columns[name]
+        v = col.value if isinstance(col, _Const) else col[i]
+        if v is None:
+            return _field_default(name)
+        if name == "jinja":
+            return copy.deepcopy(v)  # 테이블에 저장된 dict 를 밖으로 내보내지 않음
+        return v
+
+    def column(self, name: str) -> list:
+        """All values of one field (defaults filled in)."""
+        col = self._columns[name]
+        values = [col.value] * self._n if isinstance(col, _Const) else col
+        if name == "jinja":
+            return [_field_default(name) if v is None else copy.deepcopy(v) for v in values]
+        default = _field_default(name)
+        return [default if v is None else v for v in values]
+
+    @property
+    def uris(self) -> List[str]:
+        return self.column("uri")
+
+    def to_io(self, i: int) -> Base_io:
+        """Materialize row `i` as a Base_io."""
+        return self[i].to_io()
+
+    def iter_ios(self) -> Iterator[Base_io]:
+        """Materialize every row as a Base_io (column lookups resolved once, not per cell)."""
+        consts, lists = self._io_columns()
+        for i in range(self._n):
+            yield self._make_io(consts, lists, i)
+
+    def _io_columns(self):
+        # 상수 컬럼은 한 번만, None(기본값) 은 아예 넘기지 않아 Base_io 가 채우게 함
+        consts: Dict[str, Any] = {}
+        lists = []
+        for name in self.COLUMNS:
+            col = self._columns[name]
+            if isinstance(col, _Const):
+                if col.value is not None:
+                    consts[name] = col.value  # jinja 상수는 None 일 때만 생기므로 공유 걱정 없음
+            else:
+                lists.append((name, col))
+        return consts, lists
+
+    @staticmethod
+    def _make_io(consts: Dict[str, Any], lists, i: int) -> Base_io:
+        data = dict(consts)
+        for name, col in lists:
+            v = col[i]
+            if v is not None:
+                data[name] = copy.deepcopy(v) if name == "jinja" else v
+        # model_validate (pydantic-core) 가 model_construct 보다 빠름: 50k rows 0.13s vs 0.28s
+        return Base_io.model_validate(data)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        return [row.to_dict() for row in self]
+
+    def to_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame({name: self.column(name) for name in self.COLUMNS})
+
+
+class Base_io_row:
+    """Read-only view of one Base_io_table row (same attributes as Base_io)."""
+    __slots__ = ("_table", "_i")
+
+    def __init__(self, table: Base_io_table, i: int):
+        self._table = table
+        self._i = i
+
+    @property
+    def uri(self) -> str:
+        return self._table.value("uri", self._i)
+
+    @property
+    def root_path(self) -> str:
+        return self._table.value("root_path", self._i)
+
+    @property
+    def metadata_json(self) -> str:
+        return self._table.value("metadata_json", self._i)
+
+    @property
+    def force(self) -> bool:
+        return self._table.value("force", self._i)
+
+    @property
+    def jinja(self) -> Dict[str, Any]:
+        """A copy; changing it does not change the table."""
+        return self._table.value("jinja", self._i)
+
+    @property
+    def metadata_path(self) -> str:
+        return os.path.join(self.root_path, self.uri, self.metadata_json)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: self._table.value(name, self._i) for name in Base_io_table.COLUMNS}
+
+    def to_io(self) -> Base_io:
+        consts, lists = self._table._io_columns()
+        return self._table._make_io(consts, lists, self._i)  # jinja 는 deepcopy -> 테이블과 공유하지 않음
+
+    def __repr__(self) -> str:
+        return f"Base_io_row({self._i}, uri={self.uri!r})"
+
+
 if __name__ == "__main__":
     # Example usage
     io_instance = Base_io(uri="example_uri")
-    print(io_instance)
\ No newline at end of file
+    print(io_instance)
+    table = Base_io_table.from_records([{"uri": "a"}, {"uri": "b", "force": True}], root_path="/tmp")
+    print(table[1].to_io())
\ No newline at end of file
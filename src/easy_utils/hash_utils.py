@@ -0,0 +1,282 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+import os
+import hashlib
+import mmap
+import stat
+import threading
+
+from .os_utils import read_json, write_json_atomic
+
+DEFAULT_ALGO = "blake2b"
+CHUNK_SIZE = 1 << 20      # 1 MiB read buffer
+PARTIAL_SIZE = 1 << 16    # head + tail bytes used by the partial hash
+
+def hash_file(
+    path: str,
+    algo: str = DEFAULT_ALGO,
+    chunk_size: int = CHUNK_SIZE,
+    use_mmap: bool = False,
+) -> str:
+    """
+    Full content hash (hex) of `path`.
+    Reads with one reusable `chunk_size` buffer, or through mmap if use_mmap=True.
+    """
+    h = hashlib.new(algo)
+    with open(path, "rb") as f:
+        if use_mmap:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        for i in range(0, size, chunk_size):
+                            h.update(view[i:i + chunk_size])
+                    finally:
+                        view.release()
+            return h.hexdigest()
+
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+def hash_file_partial(path: str, partial_size: int = PARTIAL_SIZE, algo: str = DEFAULT_ALGO) -> str:
+    """
+    Hash of the first and last `partial_size` bytes (+ file size).
+    Cheap pre-filter: different partial hash -> different content.
+    """
+    h = hashlib.new(algo)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        h.update(str(size).encode())
+        h.update(f.read(partial_size))
+        if size > 2 * partial_size:
+            f.seek(size - partial_size)
+            h.update(f.read(partial_size))
+        elif size > partial_size:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class HashCache:
+    """
+    Content hash cache keyed by absolute path, valid while (size, mtime_ns) are unchanged.
+    Saved as JSON (atomic write) so re-runs only hash new or modified files.
+
+    cache = HashCache("/data/.hash_cache.json")
+    find_duplicates("/data", (".wav", ".mp4"), cache=cache)
+    """
+
+    def __init__(self, path: Optional[str] = None, algo: str = DEFAULT_ALGO, partial_size: int = PARTIAL_SIZE):
+        self.path = os.fspath(path) if path is not None else None
+        self.algo = algo
+        self.partial_size = partial_size
+        self._lock = threading.Lock()
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.path is not None:
+            try:
+                data = read_json(self.path)
+            except ValueError:
+                # 깨진 캐시 파일은 버리고 새로 만듦
+                data = {}
+            # 알고리즘/partial 크기가 바뀌면 캐시를 버림
+            if data.get("algo") == algo and data.get("partial_size") == partial_size:
+                self._files = data.get("files", {})
+
+    def __len__(self):
+        return len(self._files)
+
+    def _lookup(self, path: str, kind: str, st: os.stat_result) -> Optional[str]:
+        entry = self._files.get(os.path.abspath(path))
+        if entry is None or entry["size"] != st.st_size or entry["mtime_ns"] != st.st_mtime_ns:
+            return None
+        return entry.get(kind)
+
+    def _store(self, path: str, kind: str, st: os.stat_result, digest: str):
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is None or entry["size"] != st.st_size or entry["mtime_ns"] != st.st_mtime_ns:
+                entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+                self._files[key] = entry
+            entry[kind] = digest
+            self._dirty = True
+
+    def full(self, path: str, st: Optional[os.stat_result] = None, use_mmap: bool = False) -> str:
+        st = st or os.stat(path)
+        digest = self._lookup(path, "full", st)
+        if digest is None:
+            digest = hash_file(path, self.algo, use_mmap=use_mmap)
+            self._store(path, "full", st, digest)
+        return digest
+
+    def partial(self, path: str, st: Optional[os.stat_result] = None) -> str:
+        st = st or os.stat(path)
+        # 작은 파일은 partial == 전체 내용이므로 full 해시를 그대로 사용
+        if st.st_size <= 2 * self.partial_size:
+            return self.full(path, st)
+        digest = self._lookup(path, "partial", st)
+        if digest is None:
+            digest = hash_file_partial(path, self.partial_size, self.algo)
+            self._store(path, "partial", st, digest)
+        return digest
+
+    def save(self, path: Optional[str] = None) -> Optional[str]:
+        path = path or self.path
+        if path is None or not self._dirty:
+            return path
+        with self._lock:
+            data = {"algo": self.algo, "partial_size": self.partial_size, "files": dict(self._files)}
+            self._dirty = False
+        write_json_atomic(path, data, indent=None)  # 큰 캐시 -> 들여쓰기 없이
+        return path
+
+
+def _lstat_or_none(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.lstat(path)
+    except OSError:
+        return None
+
+def _stat_all(files: List[str], workers: int) -> List[Tuple[str, os.stat_result]]:
+    """
+    (path, stat) for every regular file that still exists (files removed since listing are skipped).
+    Symlinks are skipped and hard links to the same inode are kept once (first path wins):
+    they share storage, so deleting one of them frees nothing.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        stats = list(ex.map(_lstat_or_none, files))
+    out, seen = [], set()
+    for p, st in zip(files, stats):
+        if st is None or not stat.S_ISREG(st.st_mode):
+            continue
+        inode = (st.st_dev, st.st_ino)
+        if inode in seen:
+            continue
+        seen.add(inode)
+        out.append((p, st))
+    return out
+
+def _group_by(
+    items: List[Tuple[str, os.stat_result]],
+    key_fn,
+    workers: int,
+) -> List[List[Tuple[str, os.stat_result]]]:
+    """
+    Group `items` by key_fn(path, st) computed in parallel; keep groups with 2+ files.
+    Files that can no longer be read (removed mid-scan) are dropped.
+    """
+    def _key(item):
+        try:
+            return key_fn(*item)
+        except OSError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        keys = list(ex.map(_key, items))
+    groups: Dict[Any, List[Tuple[str, os.stat_result]]] = {}
+    for item, key in zip(items, keys):
+        if key is not None:
+            groups.setdefault(key, []).append(item)
+    return [g for g in groups.values() if len(g) > 1]
+
+def find_duplicate_files(
+    files: Iterable[str],
+    workers: int = 8,
+    cache: Optional[HashCache] = None,
+    min_size: int = 1,
+    use_mmap: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Find groups of files with identical content.
+    1) group by size  2) same-size files by partial hash  3) survivors by full hash.
+    Only files that collide at the previous step are read, so most files are never hashed.
+    Symlinks are ignored and hard links to one inode count as a single file.
+
+    Returns [{'hash': ..., 'size': ..., 'files': [...]}, ...], largest wasted bytes first.
+    """
+    if cache is None:
+        cache = HashCache()
+    files = list(dict.fromkeys(files))  # 순서 유지 중복 제거
+    stats = [(p, st) for p, st in _stat_all(files, workers) if st.st_size >= min_size]
+
+    by_size: Dict[int, List[Tuple[str, os.stat_result]]] = {}
+    for p, st in stats:
+        by_size.setdefault(st.st_size, []).append((p, st))
+    candidates = [item for g in by_size.values() if len(g) > 1 for item in g]
+
+    candidates = [item for g in _group_by(candidates, lambda p, st: (st.st_size, cache.partial(p, st)), workers)
+                  for item in g]
+    full_groups = _group_by(candidates, lambda p, st: (st.st_size, cache.full(p, st, use_mmap)), workers)
+    cache.save()
+
+    out = []
+    for g in full_groups:
+        size = g[0][1].st_size
+        out.append({"hash": cache.full(g[0][0], g[0][1]), "size": size, "files": sorted(p for p, _ in g)})
+    out.sort(key=lambda d: (-(len(d["files"]) - 1) * d["size"], d["files"][0]))
+    return out
+
+def find_duplicates(
+    path: str,
+    ext, # single extension or list/tuple of extensions (same as extlist)
+    exclude_hidden_folders: bool = True,
+    exclude_hidden_files: bool = True,
+    workers: int = 8,
+    cache: Optional[HashCache] = None,
+    cache_path: Optional[str] = None,
+    min_size: int = 1,
+    use_mmap: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    find_duplicate_files over extlist(path, ext).
+    cache_path: JSON hash cache to load and update (ignored if `cache` is given).
+
+    groups = find_duplicates("/data/assets", (".wav", ".mp4"), cache_path="/data/.hash_cache.json")
+    print(duplicate_report(groups))
+    """
+    from .os_utils import extlist
+
+    files = extlist(path, ext, exclude_hidden_folders=exclude_hidden_folders,
+                    exclude_hidden_files=exclude_hidden_files)
+    if cache is None:
+        cache = HashCache(cache_path)
+    return find_duplicate_files(files, workers=workers, cache=cache, min_size=min_size, use_mmap=use_mmap)
+
+def duplicate_report(groups: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summary of find_duplicates output (wasted_bytes = bytes freed by keeping one copy per group)."""
+    return {
+        "n_groups": len(groups),
+        "n_duplicate_files": sum(len(g["files"]) - 1 for g in groups),
+        "wasted_bytes": sum((len(g["files"]) - 1) * g["size"] for g in groups),
+        "groups": groups,
+    }
+
+def same_content(a: str, b: str, cache: Optional[HashCache] = None) -> bool:
+    """True if `a` and `b` exist and have identical content (size check first, then cached hashes)."""
+    try:
+        st_a, st_b = os.stat(a), os.stat(b)
+    except FileNotFoundError:
+        return False
+    if st_a.st_size != st_b.st_size:
+        return False
+    if cache is None:
+        cache = HashCache()
+    if cache.partial(a, st_a) != cache.partial(b, st_b):
+        return False
+    return cache.full(a, st_a) == cache.full(b, st_b)
+
+
+if __name__ == "__main__":
+    # Example usage
+    test_dir = "/mnt/CINELINGO_BACKUP/CineLingo/easy_utils/assets"
+    groups = find_duplicates(test_dir, (".wav", ".mp4"))
+    report = duplicate_report(groups)
+    print(report["n_groups"], report["wasted_bytes"])
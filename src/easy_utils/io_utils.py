@@ -1,14 +1,13 @@
 from __future__ import annotations
-from pydantic import BaseModel, Field, model_validator, field_validator, ConfigDict
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, TYPE_CHECKING
 import os
-import pandas as pd
 import re
-import yaml
 from pathlib import Path
-from jinja2.sandbox import SandboxedEnvironment
-from jinja2 import Environment, meta as jinja_meta, nodes
-from jinja2.visitor import NodeVisitor
+
+# pandas / yaml / jinja2 are imported inside the functions that use them,
+# so importing this module (or easy_utils) stays fast.
+if TYPE_CHECKING:
+    from jinja2 import nodes
 
 def csv_to_srt(
     csv_file: str,
@@ -30,6 +29,8 @@ def csv_to_srt(
         speaker_key (str): Column name for speaker names.
         include_speaker (bool): If True, prepend the speaker name to each subtitle line.
     """
+    import pandas as pd
+
     # 1) Load CSV into TTS_CSV (handles time conversion, diff, merging, etc.)
     df = pd.read_csv(csv_file)
 
@@ -80,6 +81,8 @@ def parse_inputs_meta(tpl_src: str) -> Dict[str, Any]:
     """
     inputs: 블록을 견고하게 파싱 (주석/빈줄 허용, 최상위 키에서 종료).
     """
+    import yaml
+
     lines = tpl_src.splitlines(True)
     start_idx = None
     for i, line in enumerate(lines):
@@ -109,6 +112,9 @@ def parse_inputs_meta(tpl_src: str) -> Dict[str, Any]:
 
 
 def extract_jinja_default_filters_ast(tpl_src: str) -> dict[str, object]:
+    from jinja2 import Environment, nodes
+    from jinja2.visitor import NodeVisitor
+
     env = Environment()
     ast = env.parse(tpl_src)
     out: dict[str, object] = {}
@@ -156,6 +162,8 @@ def extract_jinja_default_filters_ast(tpl_src: str) -> dict[str, object]:
 # --- helpers --------------------------------------------------------------
 
 def _cast_value(kind: str, val):
+    import yaml
+
     if val is None:
         return None
     try:
@@ -286,6 +294,10 @@ def read_yaml(yaml_path: str, ctx: Optional[dict[str, object]] = None) -> dict[s
     ➤ `ctx` > `inputs:` > `| default('...')`
     순으로 값이 결정됩니다.
     """
+    import yaml
+    from jinja2 import meta as jinja_meta
+    from jinja2.sandbox import SandboxedEnvironment
+
     yaml_txt = Path(yaml_path).read_text(encoding="utf-8").lstrip("\ufeff")
 
     # 1) inputs / jinja 분석
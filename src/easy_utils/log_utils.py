@@ -101,12 +101,18 @@ def find_package_path(package_name):
     # 첫 번째 경로를 절대 경로로 반환
     return os.path.abspath(namespace_path[0])
 
-def copy_all_files(src, dst):
+def copy_all_files(src, dst, skip_identical=False, hash_cache=None):
     # copy all files from src to dst
     # except EXCEPTION_FOLDERS and EXCEPTION_EXTENSIONS
+    # skip_identical=True: skip files whose dst already has the same content
+    # hash_cache: HashCache (or its JSON path, str or PathLike) so re-runs don't re-hash unchanged files
     if not os.path.exists(dst):
         os.makedirs(dst)
 
+    if skip_identical:
+        from .hash_utils import HashCache, same_content
+        cache = hash_cache if isinstance(hash_cache, HashCache) else HashCache(hash_cache)
+
     for root, dirs, files in os.walk(src):
         # 제외할 폴더 필터링
         dirs[:] = [d for d in dirs if d not in EXCEPTION_FOLDERS]
@@ -127,4 +133,9 @@ def copy_all_files(src, dst):
             
             # 파일 복사
             dest_file = os.path.join(dest_dir, file)
-            shutil.copy2(src_file, dest_file)
\ No newline at end of file
+            if skip_identical and same_content(src_file, dest_file, cache):
+                continue
+            shutil.copy2(src_file, dest_file)
+
+    if skip_identical:
+        cache.save()
\ No newline at end of file
@@ -0,0 +1,325 @@
+from __future__ import annotations
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+import os
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from .os_utils import read_json, write_json_atomic
+
+# process-wide LRU cache: absolute file path -> (mtime_ns, size, data)
+# at most CACHE_MAX_ENTRIES files are kept; the least recently used one is dropped first.
+CACHE_MAX_ENTRIES = 10000
+_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+def _cache_get(key: str) -> Optional[Tuple[int, int, Dict[str, Any]]]:
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None:
+            _CACHE.move_to_end(key)
+        return hit
+
+def _cache_put(key: str, value: Tuple[int, int, Dict[str, Any]]):
+    with _CACHE_LOCK:
+        _CACHE[key] = value
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > CACHE_MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+
+def metadata_path(root_path: str, uri: str, metadata_json: str = "metadata.json") -> str:
+    """root_path/uri/metadata.json"""
+    return os.path.join(root_path, uri, metadata_json)
+
+def _json_path(field: str) -> str:
+    """'a.b' -> '$."a"."b"' (SQLite JSON path)"""
+    return "$" + "".join('."{}"'.format(p.replace('"', '\\"')) for p in field.split("."))
+
+def _has_field(data: Dict[str, Any], field: str) -> bool:
+    cur: Any = data
+    for p in field.split("."):
+        if not isinstance(cur, dict) or p not in cur:
+            return False
+        cur = cur[p]
+    return True
+
+
+class MetadataStore:
+    """
+    Metadata store for per-uri `metadata.json` files under `root_path`.
+
+    - Files live at root_path/<uri>/<metadata_json> (same as Base_io.metadata_path).
+    - Reads go through a process-wide LRU cache (CACHE_MAX_ENTRIES files),
+      invalidated by file mtime + size.
+    - Writes are atomic (write to temp file, then rename).
+    - If `index_path` is given, every put is mirrored into a SQLite index,
+      which serves bulk reads and field queries without opening each file.
+      Each row keeps the file's mtime + size; rows whose file was changed by another
+      writer (Base_io.write_metadata, another store, external tools) are re-read on use.
+
+    Example:
+        store = MetadataStore("/data/videos", index_path="/data/videos/metadata.sqlite")
+        store.update("abc123", title="hello")
+        store.missing("title")  # uris without 'title'
+    """
+
+    def __init__(
+        self,
+        root_path: str = ".",
+        metadata_json: str = "metadata.json",
+        index_path: Optional[str] = None,
+        use_cache: bool = True,
+    ):
+        self.root_path = root_path
+        self.metadata_json = metadata_json
+        self.index_path = index_path
+        self.use_cache = use_cache
+        self._root_key = os.path.abspath(root_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        if index_path is not None:
+            self._open_index()
+
+    @classmethod
+    def from_io(cls, io, index_path: Optional[str] = None, **kwargs) -> "MetadataStore":
+        """Build a store from a Base_io (uses its root_path / metadata_json)."""
+        return cls(root_path=io.root_path, metadata_json=io.metadata_json, index_path=index_path, **kwargs)
+
+    # --- paths / files -----------------------------------------------------
+
+    def path(self, uri: str) -> str:
+        return metadata_path(self.root_path, uri, self.metadata_json)
+
+    def uris(self) -> List[str]:
+        """All uris under root_path that have a metadata file."""
+        if not os.path.isdir(self.root_path):
+            return []
+        out = []
+        with os.scandir(self.root_path) as it:
+            for entry in it:
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, self.metadata_json)):
+                    out.append(entry.name)
+        return sorted(out)
+
+    # --- single uri ----------------------------------------------------------
+
+    def get(self, uri: str) -> Dict[str, Any]:
+        """Metadata of `uri` ({} if the file does not exist). Returns a copy."""
+        path = self.path(uri)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._invalidate(uri)
+            return {}
+        return self._read(path, st)
+
+    def put(self, uri: str, data: Dict[str, Any]) -> str:
+        """Replace the metadata of `uri` with `data`."""
+        path = self.path(uri)
+        st = write_json_atomic(path, data)
+        if self.use_cache:
+            _cache_put(os.path.abspath(path), (st.st_mtime_ns, st.st_size, json.loads(json.dumps(data))))
+        if self._conn is not None:
+            self._index_put([(uri, data, st)])
+        return path
+
+    def update(self, uri: str, **fields) -> Dict[str, Any]:
+        """Merge `fields` into the metadata of `uri` (shallow) and save it."""
+        data = self.get(uri)
+        data.update(fields)
+        self.put(uri, data)
+        return data
+
+    def delete(self, uri: str):
+        """Remove the metadata file of `uri` (and its index row)."""
+        path = self.path(uri)
+        if os.path.exists(path):
+            os.remove(path)
+        self._invalidate(uri)
+        if self._conn is not None:
+            self._index_delete([uri])
+
+    # --- bulk ----------------------------------------------------------------
+
+    def get_many(self, uris: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Metadata for several uris at once.
+        With an index, rows whose file is unchanged (mtime + size) are read in one query;
+        changed, unindexed or missing files fall back to the file (and the index is refreshed).
+        """
+        uris = list(uris)
+        if self._conn is None:
+            return {uri: self.get(uri) for uri in uris}
+        existing, loaded = self._sync(uris, load=True)
+        return {uri: loaded[uri] if uri in existing else {} for uri in uris}
+
+    def put_many(self, items: Dict[str, Dict[str, Any]]):
+        """Write several uris; the index is updated in a single transaction."""
+        rows = []
+        for uri, data in items.items():
+            st = write_json_atomic(self.path(uri), data)
+            self._invalidate(uri)
+            rows.append((uri, data, st))
+        if self._conn is not None:
+            self._index_put(rows)
+
+    def missing(self, field: str, uris: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Uris whose metadata has no `field` (dotted names like 'a.b' supported).
+        `uris=None` means every uri on disk under root_path.
+        With an index, files changed by other writers are re-read before the query runs.
+        """
+        uris = self.uris() if uris is None else list(uris)
+        if self._conn is None:
+            return [u for u in uris if not _has_field(self.get(u), field)]
+
+        existing, _ = self._sync(uris, load=False)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT uri FROM metadata WHERE root_path = ? AND metadata_json = ? AND json_type(data, ?) IS NULL",
+                (self._root_key, self.metadata_json, _json_path(field)),
+            ).fetchall()
+        found = {r[0] for r in rows}
+        # 파일이 없는 uri 는 {} 로 취급 -> 항상 missing
+        return [u for u in uris if u in found or u not in existing]
+
+    # --- sqlite index ------------------------------------------------------
+
+    def reindex(self) -> int:
+        """Rebuild the index of this root_path from the metadata files on disk."""
+        if self._conn is None:
+            raise RuntimeError("MetadataStore has no index (index_path=None)")
+        items = []
+        for uri in self.uris():
+            path = self.path(uri)
+            st = os.stat(path)
+            items.append((uri, self._read(path, st), st))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM metadata WHERE root_path = ? AND metadata_json = ?", (self._root_key, self.metadata_json)
+            )
+        self._index_put(items)
+        return len(items)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _read(self, path: str, st: os.stat_result) -> Dict[str, Any]:
+        """Read `path` through the cache (hit only if mtime_ns and size are unchanged)."""
+        if not self.use_cache:
+            return read_json(path)
+        key = os.path.abspath(path)
+        hit = _cache_get(key)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return json.loads(json.dumps(hit[2]))
+        data = read_json(path)
+        _cache_put(key, (st.st_mtime_ns, st.st_size, data))
+        return json.loads(json.dumps(data))
+
+    def _open_index(self):
+        dirname = os.path.dirname(self.index_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self._conn = sqlite3.connect(self.index_path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            cols = {r[1] for r in self._conn.execute("PRAGMA table_info(metadata)")}
+            if cols and not {"metadata_json", "mtime_ns", "size"} <= cols:
+                # 예전 스키마: 인덱스는 파일에서 다시 만들 수 있으므로 버림
+                self._conn.execute("DROP TABLE metadata")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                " root_path TEXT NOT NULL,"
+                " metadata_json TEXT NOT NULL,"
+                " uri TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " PRIMARY KEY (root_path, metadata_json, uri))"
+            )
+
+    def _sync(self, uris: List[str], load: bool) -> Tuple[set, Dict[str, Dict[str, Any]]]:
+        """
+        Bring the index rows of `uris` up to date with the files.
+        Rows whose file changed (mtime_ns / size) or was never indexed are re-read and upserted;
+        rows whose file is gone are deleted.
+        Returns (uris whose file exists, {uri: data} for every existing uri if load else re-read ones).
+        """
+        rows = self._index_rows(uris)
+        existing: set = set()
+        loaded: Dict[str, Dict[str, Any]] = {}
+        stale, gone = [], []
+        for uri in uris:
+            path = self.path(uri)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                if uri in rows:
+                    gone.append(uri)
+                continue
+            existing.add(uri)
+            row = rows.get(uri)
+            if row is not None and row[1] == st.st_mtime_ns and row[2] == st.st_size:
+                if load:
+                    loaded[uri] = json.loads(row[0])
+                continue
+            data = self._read(path, st)
+            loaded[uri] = data
+            stale.append((uri, data, st))
+        if stale:
+            self._index_put(stale)
+        if gone:
+            self._index_delete(gone)
+        return existing, loaded
+
+    def _index_put(self, items: Iterable[Tuple[str, Dict[str, Any], os.stat_result]]):
+        rows = [(self._root_key, self.metadata_json, uri, json.dumps(data, ensure_ascii=False), st.st_mtime_ns, st.st_size)
+                for uri, data, st in items]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO metadata (root_path, metadata_json, uri, data, mtime_ns, size)"
+                " VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def _index_delete(self, uris: List[str]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM metadata WHERE root_path = ? AND metadata_json = ? AND uri = ?",
+                [(self._root_key, self.metadata_json, uri) for uri in uris],
+            )
+
+    def _index_rows(self, uris: List[str]) -> Dict[str, Tuple[str, int, int]]:
+        """{uri: (data json, mtime_ns, size)} for the indexed uris among `uris`."""
+        out = {}
+        # SQLite 변수 개수 제한 때문에 나눠서 조회
+        for i in range(0, len(uris), 500):
+            chunk = uris[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT uri, data, mtime_ns, size FROM metadata"
+                    f" WHERE root_path = ? AND metadata_json = ? AND uri IN ({marks})",
+                    (self._root_key, self.metadata_json, *chunk),
+                ).fetchall()
+            out.update((uri, (data, mtime_ns, size)) for uri, data, mtime_ns, size in rows)
+        return out
+
+    def _invalidate(self, uri: str):
+        with _CACHE_LOCK:
+            _CACHE.pop(os.path.abspath(self.path(uri)), None)
+
+if __name__ == "__main__":
+    # Example usage
+    store = MetadataStore("/tmp/metadata_store_example", index_path="/tmp/metadata_store_example/index.sqlite")
+    store.update("example_uri", title="hello")
+    print(store.get("example_uri"))
+    print(store.missing("duration"))
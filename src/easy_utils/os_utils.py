@@ -1,5 +1,9 @@
 import os
-from natsort import natsorted
+import json
+import stat
+import tempfile
+import threading
+from typing import Optional, Dict, Any
 
 def suffix(filename):
     """a.jpg -> jpg"""
@@ -46,6 +50,8 @@ def extlist(path,
     - Case-insensitive match if ignore_case=True.
     - Optionally exclude hidden files (starting with '.') too.
     """
+    from natsort import natsorted
+
     def _norm_ext(e):
         e = e if e.startswith('.') else ('.' + e)
         return e.lower() if ignore_case else e
@@ -99,6 +105,56 @@ def ensure_directory(path: str) -> bool:
     return False
 
 
+def read_json(path: str) -> Dict[str, Any]:
+    """Read a JSON object from `path`. Missing file -> {}."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError(f"JSON must be a dict at top level (got {type(data)}): {path}")
+    return data
+
+_UMASK_LOCK = threading.Lock()
+
+def _new_file_mode() -> int:
+    """Mode a plain open() would create a file with (0o666 minus the umask)."""
+    with _UMASK_LOCK:
+        umask = os.umask(0)
+        os.umask(umask)
+    return 0o666 & ~umask
+
+def write_json_atomic(path: str, data: Dict[str, Any], indent: Optional[int] = 2) -> os.stat_result:
+    """
+    Write `data` to `path` via temp file + os.replace.
+    Readers never see a half-written file, even with concurrent writers.
+    The file keeps the mode of the file it replaces (new files: 0o666 minus umask, like open()).
+    Returns the stat of the written file, taken before the rename so it can't belong to another writer.
+    """
+    dirname = os.path.dirname(path) or "."
+    os.makedirs(dirname, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = _new_file_mode()
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".json", dir=dirname)
+    try:
+        # mkstemp 은 0600 으로 만들기 때문에 권한을 맞춰줌
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+            st = os.fstat(f.fileno())  # rename 은 mtime/size 를 바꾸지 않음
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return st
+
+
 if __name__ == "__main__":
     # Example usage
     test_dir = "/mnt/CINELINGO_BACKUP/CineLingo/easy_utils/assets/test_files"
@@ -0,0 +1,123 @@
+from easy_utils import Base_io, Base_io_table
+
+import pandas as pd
+import pytest
+
+
+def test_from_records_defaults_match_base_io():
+    table = Base_io_table.from_records([{'uri': 'a'}, {'uri': 'b', 'force': 'true', 'jinja': {'lang': 'ko'}}])
+    assert len(table) == 2
+    assert table.uris == ['a', 'b']
+    for i, record in enumerate([{'uri': 'a'}, {'uri': 'b', 'force': 'true', 'jinja': {'lang': 'ko'}}]):
+        io = table.to_io(i)
+        assert isinstance(io, Base_io)
+        assert io == Base_io(**record)
+
+    row = table[-1]
+    assert (row.uri, row.root_path, row.metadata_json, row.force, row.jinja) == ('b', '.', 'metadata.json', True, {'lang': 'ko'})
+    assert row.metadata_path == Base_io(uri='b').metadata_path
+
+def test_table_wide_defaults_and_iteration():
+    table = Base_io_table.from_records([{'uri': f'u{i}'} for i in range(5)], root_path='/data', force=True)
+    ios = list(table.iter_ios())
+    assert [io.uri for io in ios] == [f'u{i}' for i in range(5)]
+    assert all(io.root_path == '/data' and io.force for io in ios)
+
+    # materialized objects don't share jinja dicts
+    ios[0].jinja['x'] = 1
+    assert ios[1].jinja == {}
+    assert table[0].jinja == {}
+
+def test_validation_errors_are_collected():
+    with pytest.raises(ValueError) as e:
+        Base_io_table.from_records([{'uri': 'a'}, {'root_path': '/x'}, {'uri': 3, 'force': 'maybe'}])
+    msg = str(e.value)
+    assert 'row 1, uri: Field required' in msg
+    assert 'row 2, uri' in msg
+    assert 'row 2, force' in msg
+
+    with pytest.raises(ValueError, match='uri: Field required'):
+        Base_io_table({'root_path': ['/x']}, n=1)
+
+    with pytest.raises(ValueError, match='Unknown Base_io fields'):
+        Base_io_table.from_records([{'uri': 'a'}], roots='/x')
+
+def test_from_dataframe_and_csv(tmp_path):
+    df = pd.DataFrame({
+        'uri': ['a', 'b', 'c'],
+        'root_path': ['/data', None, '/other'],
+        'force': [True, None, False],
+        'title': ['x', 'y', 'z'],  # extra columns are ignored
+    })
+    table = Base_io_table.from_dataframe(df)
+    assert table.column('root_path') == ['/data', '.', '/other']
+    assert table.column('force') == [True, False, False]
+
+    csv_path = tmp_path / 'manifest.csv'
+    csv_path.write_text('uri,jinja\n001,"{""lang"": ""ko""}"\n002,\n', encoding='utf-8')
+    table = Base_io_table.from_csv(str(csv_path), root_path='/data')
+    assert table.uris == ['001', '002']  # kept as strings
+    assert table.column('jinja') == [{'lang': 'ko'}, {}]
+    assert table.to_records()[0] == Base_io(uri='001', root_path='/data', jinja={'lang': 'ko'}).model_dump()
+    assert list(table.to_dataframe().columns) == list(Base_io_table.COLUMNS)
+
+def test_defaults_fill_missing_cells(tmp_path):
+    table = Base_io_table.from_records([{'uri': 'a', 'root_path': '/x'}, {'uri': 'b'}], root_path='/data')
+    assert table.column('root_path') == ['/x', '/data']
+    assert table.column('force') == [False, False]
+
+    csv_path = tmp_path / 'manifest.csv'
+    csv_path.write_text('uri,root_path,force\na,/x,\nb,,true\n', encoding='utf-8')
+    table = Base_io_table.from_csv(str(csv_path), root_path='/data', force=True)
+    assert table.column('root_path') == ['/x', '/data']
+    assert table.column('force') == [True, True]
+    assert list(table.iter_ios()) == [Base_io(uri='a', root_path='/x', force=True),
+                                      Base_io(uri='b', root_path='/data', force=True)]
+
+def test_validation_matches_base_io():
+    for field, record in [('root_path', {'uri': 'a', 'root_path': None}),
+                          ('force', {'uri': 'a', 'force': None}),
+                          ('jinja', {'uri': 'a', 'jinja': '{"x": 1}'}),
+                          ('uri', {'uri': None})]:
+        with pytest.raises(ValueError):
+            Base_io(**record)
+        with pytest.raises(ValueError, match=f'row 1, {field}'):
+            Base_io_table.from_records([{'uri': 'ok'}, record])
+
+    # JSON jinja only for DataFrame / CSV, decode errors are collected per row
+    df = pd.DataFrame({'uri': ['a', 'b', 'c'], 'jinja': ['{"x": 1}', '{bad', None]})
+    with pytest.raises(ValueError, match='row 1, jinja: Invalid JSON') as e:
+        Base_io_table.from_dataframe(df)
+    assert '1 validation error' in str(e.value)
+    df.loc[1, 'jinja'] = '{}'
+    assert Base_io_table.from_dataframe(df).column('jinja') == [{'x': 1}, {}, {}]
+
+def test_row_view_does_not_share_jinja():
+    table = Base_io_table.from_records([{'uri': 'a', 'jinja': {'k': {'n': 1}}}, {'uri': 'b', 'jinja': {}}])
+    table[0].jinja['x'] = 1
+    table[0].jinja['k']['n'] = 2
+    io = table.to_io(0)
+    io.jinja['k']['n'] = 99
+    assert table[0].jinja == {'k': {'n': 1}}
+
+def test_nullable_dtypes(tmp_path):
+    df = pd.DataFrame({
+        'uri': pd.Series(['a', 'b', 'c'], dtype='string'),
+        'root_path': pd.Series(['/x', None, '/z'], dtype='string'),
+        'force': pd.Series([True, None, False], dtype='boolean'),
+        'jinja': [{'k': 1}, None, [1]],  # dict / list cells are not NA checks
+    })
+    with pytest.raises(ValueError, match='row 2, jinja'):
+        Base_io_table.from_dataframe(df)
+    df['jinja'] = [{'k': 1}, None, '{"n": 2}']
+    table = Base_io_table.from_dataframe(df, root_path='/data')
+    assert table.column('root_path') == ['/x', '/data', '/z']
+    assert table.column('force') == [True, False, False]
+    assert table.column('jinja') == [{'k': 1}, {}, {'n': 2}]
+
+    csv_path = tmp_path / 'manifest.csv'
+    csv_path.write_text('uri,root_path,force\na,/x,\nb,,true\n', encoding='utf-8')
+    df = pd.read_csv(csv_path, dtype_backend='numpy_nullable')
+    table = Base_io_table.from_dataframe(df, force=True)
+    assert table.column('root_path') == ['/x', '.']
+    assert table.column('force') == [True, True]
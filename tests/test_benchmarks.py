@@ -0,0 +1,81 @@
+from easy_utils import find_root_path
+
+import json
+import sys
+
+import pytest
+
+ROOT_PATH = find_root_path('easy_utils') # package_root folder
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
+
+from benchmarks.generators import make_file_tree
+from benchmarks.runner import compare_results, load_thresholds, _parse_threshold_overrides, main
+
+META = {'commit': 'abc', 'python': '3.11.7', 'platform': 'Linux', 'created': '...', 'quick': False}
+
+def _result(meta=None, **medians):
+    return {'meta': dict(META, **(meta or {})),
+            'results': {name: {'median': m, 'min': m, 'mean': m} for name, m in medians.items()}}
+
+def _status(rows):
+    return {r['name']: r['status'] for r in rows}
+
+def test_compare_results_statuses():
+    base = _result(slow=1.0, fast=1.0, same=1.0, gone=1.0)
+    new = _result(slow=1.2, fast=0.5, same=1.05, added=1.0)
+    rows = compare_results(base, new, {'default': 0.1})
+    assert _status(rows) == {'slow': 'regression', 'fast': 'improvement', 'same': 'ok',
+                             'gone': 'removed', 'added': 'added'}
+    slow = next(r for r in rows if r['name'] == 'slow')
+    assert slow['change'] == pytest.approx(0.2)
+    assert slow['threshold'] == 0.1
+
+def test_compare_results_per_name_threshold():
+    base, new = _result(a=1.0, b=1.0), _result(a=1.2, b=1.2)
+    assert _status(compare_results(base, new, {'default': 0.1, 'a': 0.25})) == {'a': 'ok', 'b': 'regression'}
+    # no thresholds -> DEFAULT_THRESHOLD (10%)
+    assert _status(compare_results(base, new)) == {'a': 'regression', 'b': 'regression'}
+
+def test_compare_results_refuses_mismatched_runs():
+    base, new = _result(a=1.0), _result({'quick': True}, a=0.01)
+    with pytest.raises(ValueError, match='quick'):
+        compare_results(base, new)
+    assert _status(compare_results(base, new, allow_mismatch=True)) == {'a': 'improvement'}
+
+def test_thresholds_and_overrides(tmp_path):
+    path = tmp_path / 'thresholds.json'
+    path.write_text('{"default": 0.2, "read_yaml": "0.3"}', encoding='utf-8')
+    assert load_thresholds(str(path)) == {'default': 0.2, 'read_yaml': 0.3}
+    assert load_thresholds(str(tmp_path / 'nope.json')) == {}
+    assert _parse_threshold_overrides(['a=0.5', 'b=1']) == {'a': 0.5, 'b': 1.0}
+    with pytest.raises(SystemExit):
+        _parse_threshold_overrides(['a'])
+
+def test_compare_cli_exit_codes(tmp_path, capsys):
+    def dump(name, data):
+        p = tmp_path / name
+        p.write_text(json.dumps(data), encoding='utf-8')
+        return str(p)
+    base = dump('base.json', _result(a=1.0))
+    ok = dump('ok.json', _result(a=1.05))
+    slow = dump('slow.json', _result(a=2.0))
+    quick = dump('quick.json', _result({'quick': True}, a=1.0))
+    no_file = str(tmp_path / 'none.json')
+
+    assert main(['compare', base, ok, '--thresholds', no_file]) == 0
+    assert main(['compare', base, slow, '--thresholds', no_file]) == 1
+    assert main(['compare', base, slow, '--thresholds', no_file, '--threshold-for', 'a=1.5']) == 0
+    assert main(['compare', base, quick, '--thresholds', no_file]) == 2
+    assert main(['compare', base, quick, '--thresholds', no_file, '--allow-mismatch']) == 0
+    assert 'differ in quick' in capsys.readouterr().out
+
+def test_make_file_tree_dup_ratio(tmp_path):
+    def contents(root):
+        files = make_file_tree(str(root), depth=2, breadth=2, files_per_dir=20, file_size=4096, dup_ratio=0.25, seed=1)
+        return [open(f, 'rb').read() for f in files]
+    data = contents(tmp_path / 'a')
+    assert data == contents(tmp_path / 'b')  # seeded -> identical trees
+    assert len({len(d) for d in data}) > 1
+    n_dups = len(data) - len(set(data))
+    assert 0.1 * len(data) < n_dups < 0.4 * len(data)
@@ -0,0 +1,146 @@
+from easy_utils import hash_file, find_duplicates, duplicate_report, HashCache, copy_all_files
+from easy_utils.hash_utils import hash_file_partial, same_content, find_duplicate_files
+import easy_utils.hash_utils as hash_utils
+
+import hashlib
+import os
+import shutil
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return str(path)
+
+def test_hash_file(tmp_path):
+    data = os.urandom(3 * 1024 + 7)
+    path = _write(tmp_path / 'a.wav', data)
+    expected = hashlib.blake2b(data).hexdigest()
+    assert hash_file(path, chunk_size=1000) == expected
+    assert hash_file(path, chunk_size=1000, use_mmap=True) == expected
+    assert hash_file(_write(tmp_path / 'empty.wav', b''), use_mmap=True) == hashlib.blake2b(b'').hexdigest()
+
+def test_partial_hash_ignores_middle(tmp_path):
+    head, tail = b'h' * 100, b't' * 100
+    a = _write(tmp_path / 'a.wav', head + b'x' * 500 + tail)
+    b = _write(tmp_path / 'b.wav', head + b'y' * 500 + tail)
+    assert hash_file_partial(a, partial_size=100) == hash_file_partial(b, partial_size=100)
+    assert hash_file(a) != hash_file(b)
+
+def test_find_duplicates(tmp_path):
+    head, tail = b'h' * 100, b't' * 100
+    same = head + b'x' * 500 + tail
+    _write(tmp_path / 'run1' / 'a.wav', same)
+    _write(tmp_path / 'run2' / 'a.wav', same)
+    _write(tmp_path / 'run3' / 'a.WAV', same)
+    _write(tmp_path / 'run2' / 'b.wav', head + b'y' * 500 + tail)  # same size + partial, different content
+    _write(tmp_path / 'run1' / 'c.mp4', b'video')
+    _write(tmp_path / 'run2' / 'c.mp4', b'video')
+    _write(tmp_path / 'run2' / 'd.mp4', b'other')
+    _write(tmp_path / 'run1' / 'e.txt', b'video')  # not in ext
+    _write(tmp_path / 'run1' / 'empty1.wav', b'')
+    _write(tmp_path / 'run2' / 'empty2.wav', b'')
+
+    cache = HashCache(partial_size=100)
+    groups = find_duplicates(str(tmp_path), ('.wav', '.mp4'), cache=cache, workers=4)
+    assert [g['files'] for g in groups] == [
+        sorted(str(tmp_path / r / n) for r, n in [('run1', 'a.wav'), ('run2', 'a.wav'), ('run3', 'a.WAV')]),
+        [str(tmp_path / 'run1' / 'c.mp4'), str(tmp_path / 'run2' / 'c.mp4')],
+    ]
+    assert groups[0]['size'] == len(same)
+    assert groups[0]['hash'] == hashlib.blake2b(same).hexdigest()
+
+    report = duplicate_report(groups)
+    assert report['n_groups'] == 2
+    assert report['n_duplicate_files'] == 3
+    assert report['wasted_bytes'] == 2 * len(same) + 5
+
+def _count_calls(monkeypatch, module, name):
+    calls = []
+    orig = getattr(module, name)
+    def wrapped(*args, **kwargs):
+        calls.append(args)
+        return orig(*args, **kwargs)
+    monkeypatch.setattr(module, name, wrapped)
+    return calls
+
+def test_hash_cache_persists_and_invalidates(tmp_path, monkeypatch):
+    root = tmp_path / 'assets'
+    _write(root / 'a.wav', b'same')
+    _write(root / 'b.wav', b'same')
+    cache_path = str(tmp_path / 'hash_cache.json')
+
+    assert len(find_duplicates(str(root), '.wav', cache_path=cache_path)) == 1
+    assert len(HashCache(cache_path)) == 2
+
+    # re-run: nothing is re-hashed
+    calls = _count_calls(monkeypatch, hash_utils, 'hash_file')
+    assert len(find_duplicates(str(root), '.wav', cache_path=cache_path)) == 1
+    assert len(calls) == 0
+
+    # modified file (new size/mtime) is re-hashed
+    _write(root / 'b.wav', b'diff')
+    os.utime(root / 'b.wav', ns=(0, 10**9))
+    assert find_duplicates(str(root), '.wav', cache_path=cache_path) == []
+    assert len(calls) == 1  # only b.wav
+
+def test_copy_all_files_skip_identical(tmp_path, monkeypatch):
+    src, dst = tmp_path / 'src', tmp_path / 'dst'
+    _write(src / 'a.txt', b'aaa')
+    _write(src / 'sub' / 'b.txt', b'bbb')
+    copy_all_files(str(src), str(dst))
+    assert same_content(str(src / 'a.txt'), str(dst / 'a.txt'))
+
+    _write(src / 'sub' / 'b.txt', b'BBB')
+    calls = _count_calls(monkeypatch, shutil, 'copy2')
+    copy_all_files(str(src), str(dst), skip_identical=True, hash_cache=tmp_path / 'cache.json')
+    assert [c[0] for c in calls] == [os.path.join(str(src), 'sub', 'b.txt')]
+    assert (dst / 'sub' / 'b.txt').read_bytes() == b'BBB'
+    assert len(HashCache(tmp_path / 'cache.json')) > 0
+
+def test_missing_files_are_skipped(tmp_path, monkeypatch):
+    a = _write(tmp_path / 'a.wav', b'same')
+    b = _write(tmp_path / 'b.wav', b'same')
+    gone = str(tmp_path / 'gone.wav')
+    groups = find_duplicate_files([a, gone, b])
+    assert [g['files'] for g in groups] == [[a, b]]
+
+    # removed between stat and hashing
+    c = _write(tmp_path / 'c.wav', b'same')
+    orig = hash_utils.hash_file
+    def flaky(path, *args, **kwargs):
+        if path == c:
+            raise FileNotFoundError(path)
+        return orig(path, *args, **kwargs)
+    monkeypatch.setattr(hash_utils, 'hash_file', flaky)
+    assert [g['files'] for g in find_duplicate_files([a, b, c])] == [[a, b]]
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    _write(tmp_path / 'assets' / 'a.wav', b'same')
+    _write(tmp_path / 'assets' / 'b.wav', b'same')
+    cache_path = tmp_path / 'hash_cache.json'
+    cache_path.write_text('{"algo": "blake2b", "fil', encoding='utf-8')
+    assert len(find_duplicates(str(tmp_path / 'assets'), '.wav', cache_path=str(cache_path))) == 1
+    assert len(HashCache(cache_path)) == 2
+
+def test_cache_file_is_compact(tmp_path):
+    a = _write(tmp_path / 'a.wav', b'same')
+    b = _write(tmp_path / 'b.wav', b'same')
+    cache = HashCache(tmp_path / 'hash_cache.json')
+    find_duplicate_files([a, b], cache=cache)
+    text = (tmp_path / 'hash_cache.json').read_text(encoding='utf-8')
+    assert '\n' not in text
+    assert len(HashCache(tmp_path / 'hash_cache.json')) == 2
+
+def test_links_are_not_duplicates(tmp_path):
+    a = _write(tmp_path / 'a.wav', b'same')
+    os.link(a, tmp_path / 'hard.wav')
+    os.symlink(a, tmp_path / 'soft.wav')
+    groups = find_duplicates(str(tmp_path), '.wav')
+    assert groups == []
+    assert duplicate_report(groups)['wasted_bytes'] == 0
+
+    # a real copy is still reported once, next to the first path of the linked inode
+    b = _write(tmp_path / 'b.wav', b'same')
+    assert [g['files'] for g in find_duplicates(str(tmp_path), '.wav')] == [[a, b]]
@@ -0,0 +1,52 @@
+from easy_utils import find_package_path
+
+import os
+import subprocess
+import sys
+
+SRC_PATH = os.path.dirname(find_package_path('easy_utils')) # src folder
+
+def _run(code):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = SRC_PATH + os.pathsep + env.get('PYTHONPATH', '')
+    out = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+    return out.stdout.strip()
+
+def test_import_does_not_load_heavy_deps():
+    code = (
+        "import sys, easy_utils\n"
+        "print(sorted(m for m in ('pandas', 'pydantic', 'jinja2', 'yaml') if m in sys.modules))"
+    )
+    assert _run(code) == '[]'
+
+def test_light_helpers_do_not_load_heavy_deps():
+    code = (
+        "import sys\n"
+        "from easy_utils import printline, extlist, change_suffix\n"
+        "extlist('.', 'txt', sort=True)\n"
+        "print(sorted(m for m in ('pandas', 'pydantic', 'jinja2', 'yaml') if m in sys.modules))"
+    )
+    assert _run(code) == '[]'
+
+def test_lazy_attributes_resolve():
+    import easy_utils
+    from easy_utils.io_utils import read_yaml
+    assert easy_utils.read_yaml is read_yaml
+    assert set(easy_utils.__all__) <= set(dir(easy_utils))
+    try:
+        easy_utils.not_a_function
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('expected AttributeError')
+
+def test_submodules_are_attributes():
+    code = (
+        "import easy_utils\n"
+        "print(easy_utils.io_utils.csv_to_srt.__name__, easy_utils.os_utils.extlist.__name__)"
+    )
+    assert _run(code) == 'csv_to_srt extlist'
+
+    import easy_utils
+    for name in ('os_utils', 'log_utils', 'io_utils', 'base_io', 'base_task', 'metadata_store', 'hash_utils', 'cli'):
+        assert getattr(easy_utils, name).__name__ == f'easy_utils.{name}'
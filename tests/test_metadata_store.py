@@ -0,0 +1,151 @@
+from easy_utils import Base_io, MetadataStore
+import easy_utils.metadata_store as metadata_store
+
+import json
+import os
+import stat
+
+
+def test_get_put_roundtrip(tmp_path):
+    store = MetadataStore(str(tmp_path))
+    assert store.get('uri_a') == {}
+
+    path = store.put('uri_a', {'title': 'hello'})
+    assert path == os.path.join(str(tmp_path), 'uri_a', 'metadata.json')
+    assert store.get('uri_a') == {'title': 'hello'}
+
+    store.update('uri_a', duration=1.5)
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'title': 'hello', 'duration': 1.5}
+
+    # no temp files left behind
+    assert os.listdir(os.path.dirname(path)) == ['metadata.json']
+
+def test_existing_metadata_json_is_readable(tmp_path):
+    os.makedirs(tmp_path / 'uri_a')
+    (tmp_path / 'uri_a' / 'metadata.json').write_text('{"title": "old"}', encoding='utf-8')
+
+    io = Base_io(uri='uri_a', root_path=str(tmp_path))
+    assert io.metadata_path == str(tmp_path / 'uri_a' / 'metadata.json')
+    assert io.read_metadata() == {'title': 'old'}
+
+    # external rewrite is picked up despite the cache
+    (tmp_path / 'uri_a' / 'metadata.json').write_text('{"title": "new!"}', encoding='utf-8')
+    os.utime(tmp_path / 'uri_a' / 'metadata.json', ns=(0, 10**9))
+    assert io.read_metadata() == {'title': 'new!'}
+
+def test_cached_value_is_a_copy(tmp_path):
+    store = MetadataStore(str(tmp_path))
+    store.put('uri_a', {'tags': ['a']})
+    store.get('uri_a')['tags'].append('b')
+    assert store.get('uri_a') == {'tags': ['a']}
+
+def test_missing_without_index(tmp_path):
+    store = MetadataStore(str(tmp_path))
+    store.put('uri_a', {'title': 'a', 'info': {'lang': 'ko'}})
+    store.put('uri_b', {'info': {}})
+    assert store.uris() == ['uri_a', 'uri_b']
+    assert store.missing('title') == ['uri_b']
+    assert store.missing('info.lang') == ['uri_b']
+
+def test_index_bulk_and_missing(tmp_path):
+    index_path = str(tmp_path / 'index.sqlite')
+    with MetadataStore(str(tmp_path), index_path=index_path) as store:
+        store.put_many({f'uri_{i}': ({'title': str(i)} if i % 2 else {}) for i in range(10)})
+        assert store.missing('title') == ['uri_0', 'uri_2', 'uri_4', 'uri_6', 'uri_8']
+        assert store.get_many(['uri_1', 'uri_2', 'nope']) == {'uri_1': {'title': '1'}, 'uri_2': {}, 'nope': {}}
+
+        # explicit null still counts as present
+        store.put('uri_0', {'title': None})
+        assert 'uri_0' not in store.missing('title')
+
+    # files written before the index existed are picked up without reindex()
+    other = MetadataStore(str(tmp_path), index_path=str(tmp_path / 'other.sqlite'))
+    assert other.missing('title') == ['uri_2', 'uri_4', 'uri_6', 'uri_8']
+    assert other.reindex() == 10
+    assert other.missing('title') == ['uri_2', 'uri_4', 'uri_6', 'uri_8']
+    other.close()
+
+def test_cache_is_keyed_by_file(tmp_path):
+    a = MetadataStore(str(tmp_path))
+    b = MetadataStore(str(tmp_path), metadata_json='other.json')
+    a.put('u', {'which': 'A'})
+    b.put('u', {'which': 'B'})
+    # same mtime on both files (coarse timestamps)
+    for name in ('metadata.json', 'other.json'):
+        os.utime(tmp_path / 'u' / name, ns=(0, 10**9))
+    assert a.get('u') == {'which': 'A'}
+    assert b.get('u') == {'which': 'B'}
+
+    # same mtime, different size -> re-read
+    (tmp_path / 'u' / 'other.json').write_text('{"which": "BB"}', encoding='utf-8')
+    os.utime(tmp_path / 'u' / 'other.json', ns=(0, 10**9))
+    assert b.get('u') == {'which': 'BB'}
+
+def test_index_sees_writes_from_other_writers(tmp_path):
+    with MetadataStore(str(tmp_path), index_path=str(tmp_path / 'index.sqlite')) as store:
+        store.put('uri_a', {'t': 1})
+        store.put('uri_b', {'t': 1})
+
+        io = Base_io(uri='uri_a', root_path=str(tmp_path))
+        io.write_metadata({'t': 2})
+        os.utime(io.metadata_path, ns=(0, 10**9))
+        assert store.get_many(['uri_a'])['uri_a'] == {'t': 2}
+
+        io.write_metadata({})
+        assert store.missing('t') == ['uri_a']
+
+        # new file from another writer, deleted file
+        MetadataStore(str(tmp_path)).put('uri_c', {})
+        os.remove(tmp_path / 'uri_b' / 'metadata.json')
+        assert store.missing('t') == ['uri_a', 'uri_c']
+        assert store.get_many(['uri_b', 'uri_c']) == {'uri_b': {}, 'uri_c': {}}
+
+    # index shared by two metadata_json names
+    index_path = str(tmp_path / 'shared.sqlite')
+    with MetadataStore(str(tmp_path), index_path=index_path) as a, \
+            MetadataStore(str(tmp_path), metadata_json='other.json', index_path=index_path) as b:
+        a.put('uri_x', {'t': 1})
+        b.put('uri_x', {})
+        assert a.get_many(['uri_x']) == {'uri_x': {'t': 1}}
+        assert b.missing('t', ['uri_x']) == ['uri_x']
+        assert a.missing('t', ['uri_x']) == []
+
+def test_written_files_get_umask_mode(tmp_path):
+    old = os.umask(0o022)
+    try:
+        store = MetadataStore(str(tmp_path))
+        path = store.put('uri_a', {'t': 1})
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+        # existing mode is kept
+        os.chmod(path, 0o640)
+        store.put('uri_a', {'t': 2})
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    finally:
+        os.umask(old)
+
+def test_put_stat_is_taken_before_rename(tmp_path, monkeypatch):
+    store = MetadataStore(str(tmp_path), index_path=str(tmp_path / 'index.sqlite'))
+    real_replace = os.replace
+
+    def replace_then_other_writer(src, dst):
+        real_replace(src, dst)
+        with open(dst, 'w', encoding='utf-8') as f:
+            f.write('{"writer": "other process"}')
+
+    monkeypatch.setattr(metadata_store.os, 'replace', replace_then_other_writer)
+    store.put('uri_a', {'writer': 'me'})
+    monkeypatch.undo()
+    assert store.get('uri_a') == {'writer': 'other process'}
+    assert store.get_many(['uri_a']) == {'uri_a': {'writer': 'other process'}}
+    store.close()
+
+def test_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_store, 'CACHE_MAX_ENTRIES', 3)
+    store = MetadataStore(str(tmp_path))
+    for i in range(5):
+        store.put(f'uri_{i}', {'i': i})
+    assert len(metadata_store._CACHE) <= 3
+    store.get('uri_0')
+    assert os.path.abspath(store.path('uri_0')) in metadata_store._CACHE